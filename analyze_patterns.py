@@ -6,12 +6,29 @@ Analyze patterns in word corrections and accepted words.
 import csv
 import re
 from collections import defaultdict, Counter
+from itertools import islice
 
-def normalize_for_comparison(word):
-    """Remove diacritics for easier pattern comparison."""
-    import unicodedata
-    nfd = unicodedata.normalize('NFD', word)
-    return ''.join(c for c in nfd if unicodedata.category(c) != 'Mn')
+# Stem substrings for each accepted-word category, in priority order
+STEM_CATEGORIES = [
+    # Lambda future forms (λήψ- vs λημψ-)
+    ('Lambda future (λήψ- vs λημψ-)', ('λήψ', 'λημψ')),
+    # Aorist passive forms (-ληφθ- vs -λημφθ-)
+    ('Aorist passive (λήφθη vs λήμφθη)', ('ληφθ', 'λημφθ', 'ληψθ')),
+    # Destruction verbs (ὀλοθρ- vs ὀλεθρ- and ἐξολοθρ- vs ἐξολεθρ-)
+    ('Destruction verbs (ὀλοθρ- vs ὀλεθρ-)', ('ολοθρ', 'ολεθρ')),
+    # Loan/borrow verbs (δανε- vs δανι-)
+    ('Loan verbs (δανε- vs δανι-)', ('δανε', 'δανι')),
+    # Circumcision forms (περιτεμ- variations)
+    ('Circumcision (περιτεμ- variations)', ('περιτεμ',)),
+    # Generation/produce words (γενν- vs γενη-)
+    ('Generation/produce (γενν- vs γενη-)', ('γενν', 'γενημ', 'γεννημ')),
+    # Command verbs (ἐντ- variations)
+    ('Command verbs (ἐντέλλ- variations)', ('ἀντέλλ', 'ἐντέλλ', 'ἐντλλ')),
+]
+STEM_PATTERN = re.compile('|'.join(
+    re.escape(stem) for _, stems in STEM_CATEGORIES for stem in stems
+))
+COMPOUND_PREFIXES = ('κατα', 'ἐπι', 'ἀπο', 'συν', 'ἐξ', 'ἀν')
 
 def analyze_corrections():
     """Analyze transcription error patterns in word_corrections.tsv"""
@@ -31,17 +48,20 @@ def analyze_corrections():
     
     # Analyze character substitutions
     substitutions = Counter()
-    insertions = []
-    deletions = []
-    transpositions = []
+    # Only the first few examples of each kind are printed, so keep no more
+    insertions = []     # first 15
+    deletions = []      # first 15
+    transpositions = [] # first 10
     
     for verse, wrong, right in corrections:
-        wrong_norm = normalize_for_comparison(wrong)
-        right_norm = normalize_for_comparison(right)
-        
         if len(wrong) == len(right):
-            # Same length - check for substitutions or transpositions
-            diffs = [(i, wrong[i], right[i]) for i in range(len(wrong)) if wrong[i] != right[i]]
+            # Same length - check for substitutions or transpositions.
+            # Only one or two differences are classified, so stop after three.
+            diffs = list(islice(
+                ((i, w_char, r_char) for i, (w_char, r_char) in enumerate(zip(wrong, right))
+                 if w_char != r_char),
+                3
+            ))
             
             if len(diffs) == 1:
                 pos, w_char, r_char = diffs[0]
@@ -50,16 +70,18 @@ def analyze_corrections():
                 # Possible transposition
                 i1, w1, r1 = diffs[0]
                 i2, w2, r2 = diffs[1]
-                if i2 == i1 + 1 and w1 == r2 and w2 == r1:
+                if i2 == i1 + 1 and w1 == r2 and w2 == r1 and len(transpositions) < 10:
                     transpositions.append((wrong, right, w1+w2, r1+r2))
         
         elif len(wrong) < len(right):
             # Missing character(s)
-            insertions.append((wrong, right))
+            if len(insertions) < 15:
+                insertions.append((wrong, right))
         
         elif len(wrong) > len(right):
             # Extra character(s)
-            deletions.append((wrong, right))
+            if len(deletions) < 15:
+                deletions.append((wrong, right))
     
     print("\n1. CHARACTER SUBSTITUTIONS (OCR/transcription errors):")
     print("-"*70)
@@ -68,18 +90,18 @@ def analyze_corrections():
     
     print("\n\n2. COMMON INSERTION ERRORS (missing characters):")
     print("-"*70)
-    for wrong, right in insertions[:15]:
+    for wrong, right in insertions:
         print(f"  {wrong} → {right}")
     
     print("\n\n3. COMMON DELETION ERRORS (extra characters):")
     print("-"*70)
-    for wrong, right in deletions[:15]:
+    for wrong, right in deletions:
         print(f"  {wrong} → {right}")
     
     if transpositions:
         print("\n\n4. TRANSPOSITION ERRORS:")
         print("-"*70)
-        for wrong, right, w_chars, r_chars in transpositions[:10]:
+        for wrong, right, w_chars, r_chars in transpositions:
             print(f"  {wrong} → {right} (swapped {w_chars} ↔ {r_chars})")
 
 
@@ -106,36 +128,15 @@ def analyze_accepted_words():
     for word in accepted:
         word_lower = word.lower()
         
-        # Lambda future forms (λήψ- vs λημψ-)
-        if 'λήψ' in word_lower or 'λημψ' in word_lower:
-            categories['Lambda future (λήψ- vs λημψ-)'].append(word)
-        
-        # Aorist passive forms (-ληφθ- vs -λημφθ-)  
-        elif 'ληφθ' in word_lower or 'λημφθ' in word_lower or 'ληψθ' in word_lower:
-            categories['Aorist passive (λήφθη vs λήμφθη)'].append(word)
-        
-        # Destruction verbs (ὀλοθρ- vs ὀλεθρ- and ἐξολοθρ- vs ἐξολεθρ-)
-        elif 'ολοθρ' in word_lower or 'ολεθρ' in word_lower:
-            categories['Destruction verbs (ὀλοθρ- vs ὀλεθρ-)'].append(word)
-        
-        # Loan/borrow verbs (δανε- vs δανι-)
-        elif 'δανε' in word_lower or 'δανι' in word_lower:
-            categories['Loan verbs (δανε- vs δανι-)'].append(word)
-        
-        # Circumcision forms (περιτεμ- variations)
-        elif 'περιτεμ' in word_lower:
-            categories['Circumcision (περιτεμ- variations)'].append(word)
-        
-        # Generation/produce words (γενν- vs γενη-)
-        elif 'γενν' in word_lower or 'γενημ' in word_lower or 'γεννημ' in word_lower:
-            categories['Generation/produce (γενν- vs γενη-)'].append(word)
-        
-        # Command verbs (ἐντ- variations)
-        elif 'ἀντέλλ' in word_lower or 'ἐντέλλ' in word_lower or 'ἐντλλ' in word_lower:
-            categories['Command verbs (ἐντέλλ- variations)'].append(word)
+        # Stem-based categories, checked in priority order. A single scan
+        # with STEM_PATTERN rules out words that contain none of the stems.
+        if STEM_PATTERN.search(word_lower):
+            category = next(category for category, stems in STEM_CATEGORIES
+                            if any(stem in word_lower for stem in stems))
+            categories[category].append(word)
         
         # Other compound verb variations
-        elif any(prefix in word_lower for prefix in ['κατα', 'ἐπι', 'ἀπο', 'συν', 'ἐξ', 'ἀν']):
+        elif any(prefix in word_lower for prefix in COMPOUND_PREFIXES):
             if len(word) > 8:  # Long compounds
                 categories['Compound verb variations'].append(word)
         
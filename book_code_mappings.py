@@ -20,8 +20,10 @@ Notes:
 - The second occurrence of ΕΣΔΡΑΣ in Brenton refers to 1 Esdras (apocryphal)
 """
 
+from types import MappingProxyType
+
 # Mapping from Brenton Greek book names to Swete book codes
-BRENTON_TO_SWETE = {
+BRENTON_TO_SWETE = MappingProxyType({
     # Pentateuch
     "ΓΕΝΕΣΙΣ": "Gen",
     "ΕΞΟΔΟΣ": "Exo",
@@ -91,10 +93,10 @@ BRENTON_TO_SWETE = {
     "ΜΑΚΚΑΒΑΙΩΝ Γ": "3Ma",  # 3 Maccabees
     "ΜΑΚΚΑΒΑΙΩΝ Δ": "4Ma",  # 4 Maccabees
     "ΠΡΟΣΕΥΧΗ ΜΑΝΑΣΣΗ ΥΙΟΥ ΕΖΕΚΙΟΥ": "Ode",  # Prayer of Manasseh (often in Odes)
-}
+})
 
 # Mapping from Brenton Greek book names to Rahlfs book codes
-BRENTON_TO_RAHLFS = {
+BRENTON_TO_RAHLFS = MappingProxyType({
     # Pentateuch
     "ΓΕΝΕΣΙΣ": "Gen",
     "ΕΞΟΔΟΣ": "Exod",
@@ -185,17 +187,45 @@ BRENTON_TO_RAHLFS = {
     "ΜΑΚΚΑΒΑΙΩΝ Γ": "3Macc",  # 3 Maccabees
     "ΜΑΚΚΑΒΑΙΩΝ Δ": "4Macc",  # 4 Maccabees
     "ΠΡΟΣΕΥΧΗ ΜΑΝΑΣΣΗ ΥΙΟΥ ΕΖΕΚΙΟΥ": "Odes",  # Prayer of Manasseh (in Odes)
-}
+})
 
 # Note: ΕΣΔΡΑΣ and ΕΣΔΡΑΣ Α are now distinct in Brenton
 # - ΕΣΔΡΑΣ = canonical Ezra (appears after 2 Chronicles)
 # - ΝΕΕΜΙΑΣ = Nehemiah (appears after Ezra)
 # - ΕΣΔΡΑΣ Α = 1 Esdras apocryphal (appears after Malachi)
 
+# Rahlfs numbers Nehemiah chapters 1-13 as 2Esdr chapters 11-23
+NEHEMIAH_RAHLFS_CHAPTER_OFFSET = 10
+
+
+def reverse_mapping(mapping):
+    """
+    Build a read-only reverse mapping from edition code to Brenton book names.
+    
+    Values are tuples because several Brenton books can share one code
+    (e.g., ΕΣΔΡΑΣ and ΝΕΕΜΙΑΣ both map to 2Esdr in Rahlfs).
+    """
+    reverse = {}
+    for brenton_book, code in mapping.items():
+        reverse.setdefault(code, []).append(brenton_book)
+    return MappingProxyType({code: tuple(books) for code, books in reverse.items()})
 
-# Reverse mappings (for convenience)
-SWETE_TO_BRENTON = {v: k for k, v in BRENTON_TO_SWETE.items()}
-RAHLFS_TO_BRENTON = {v: k for k, v in BRENTON_TO_RAHLFS.items()}
+
+# Reverse mappings (for convenience): edition code -> tuple of Brenton book names
+SWETE_TO_BRENTON = reverse_mapping(BRENTON_TO_SWETE)
+RAHLFS_TO_BRENTON = reverse_mapping(BRENTON_TO_RAHLFS)
+
+
+# Precomputed reference builders: Brenton book -> function(chapter, verse) -> reference string
+RAHLFS_REFERENCE_BUILDERS = MappingProxyType({
+    **{book: (lambda chapter, verse, code=code: f"{code}.{chapter}.{verse}")
+       for book, code in BRENTON_TO_RAHLFS.items()},
+    "ΝΕΕΜΙΑΣ": lambda chapter, verse: f"2Esdr.{chapter + NEHEMIAH_RAHLFS_CHAPTER_OFFSET}.{verse}",
+})
+SWETE_REFERENCE_BUILDERS = MappingProxyType({
+    book: (lambda chapter, verse, code=code: f"{code}.{chapter}:{verse}")
+    for book, code in BRENTON_TO_SWETE.items()
+})
 
 
 # Utility functions for verse reference conversion
@@ -225,8 +255,7 @@ def convert_brenton_chapter_to_rahlfs(brenton_book: str, brenton_chapter: int) -
         ('Gen', 14)
     """
     if brenton_book == "ΝΕΕΜΙΑΣ":
-        # Nehemiah chapters 1-13 map to 2Esdr chapters 11-23
-        return ("2Esdr", brenton_chapter + 10)
+        return ("2Esdr", brenton_chapter + NEHEMIAH_RAHLFS_CHAPTER_OFFSET)
     
     # For all other books (including ΕΣΔΡΑΣ), use the standard mapping
     rahlfs_book = BRENTON_TO_RAHLFS.get(brenton_book)
@@ -285,8 +314,10 @@ def convert_brenton_reference_to_rahlfs(brenton_book: str, chapter: int, verse:
         >>> convert_brenton_reference_to_rahlfs("ΝΕΕΜΙΑΣ", 1, 2)
         '2Esdr.11.2'
     """
-    rahlfs_book, rahlfs_chapter = convert_brenton_chapter_to_rahlfs(brenton_book, chapter)
-    return f"{rahlfs_book}.{rahlfs_chapter}.{verse}"
+    try:
+        return RAHLFS_REFERENCE_BUILDERS[brenton_book](chapter, verse)
+    except KeyError:
+        raise ValueError(f"Unknown Brenton book: {brenton_book}") from None
 
 
 def convert_brenton_reference_to_swete(brenton_book: str, chapter: int, verse: int) -> str:
@@ -309,8 +340,10 @@ def convert_brenton_reference_to_swete(brenton_book: str, chapter: int, verse: i
         >>> convert_brenton_reference_to_swete("ΝΕΕΜΙΑΣ", 1, 2)
         'Neh.1:2'
     """
-    swete_book, swete_chapter = convert_brenton_chapter_to_swete(brenton_book, chapter)
-    return f"{swete_book}.{swete_chapter}:{verse}"
+    try:
+        return SWETE_REFERENCE_BUILDERS[brenton_book](chapter, verse)
+    except KeyError:
+        raise ValueError(f"Unknown Brenton book: {brenton_book}") from None
 
 
 def parse_brenton_reference(reference: str) -> tuple[str, int, int]:
@@ -356,8 +389,8 @@ def parse_brenton_reference(reference: str) -> tuple[str, int, int]:
     
     return (book_name, chapter, verse)
 
-# Note: The reverse mappings will have duplicates for books with multiple versions
-# For example, both "JoshA" and "JoshB" would need special handling
+# Note: The reverse mappings keep every Brenton book for a shared code
+# For example, RAHLFS_TO_BRENTON["2Esdr"] == ("ΕΣΔΡΑΣ", "ΝΕΕΜΙΑΣ")
 
 
 # Additional notes for uncertain mappings:
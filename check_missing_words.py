@@ -5,67 +5,138 @@ rahlfs_words.csv or swete_words.csv files.
 """
 
 import re
+import os
+import sys
+import glob
+import pickle
 import unicodedata
 import csv
 import argparse
+import multiprocessing
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack
+from functools import lru_cache
+from itertools import tee
 from difflib import SequenceMatcher
 from book_code_mappings import (
     convert_brenton_reference_to_rahlfs,
     convert_brenton_reference_to_swete
 )
-from valid_variation_patterns import generate_variation_list, strip_accents as strip_accents_vvp
+from valid_variation_patterns import (
+    COMBINING_MARKS_TABLE,
+    generate_variation_list
+)
 
 # Module-level global variables for loaded data
 RAHLFS_WORDS_DICT = {}  # word_id -> {'normalized': str, 'original': str}
 SWETE_WORDS_DICT = {}   # word_id -> {'normalized': str, 'original': str}
+RAHLFS_MAX_WORD_ID = 0  # highest word_id in RAHLFS_WORDS_DICT, where the last verse ends
+SWETE_MAX_WORD_ID = 0   # highest word_id in SWETE_WORDS_DICT
 RAHLFS_WORDS = {}       # normalized -> original (derived from RAHLFS_WORDS_DICT)
 SWETE_WORDS = {}        # normalized -> original (derived from SWETE_WORDS_DICT)
+KNOWN_WORDS = frozenset()  # union of RAHLFS_WORDS and SWETE_WORDS keys, for membership checks
+KNOWN_WORD_FORMS = frozenset()  # KNOWN_WORDS plus each one ending in ν with the ν removed
+RAHLFS_LENGTH_INDEX = None  # build_length_index(RAHLFS_WORDS) for corpus-wide typo searches; None means a plain scan
+SWETE_LENGTH_INDEX = None   # build_length_index(SWETE_WORDS), likewise
+COMPARISON_FORMS = {}   # normalized -> normalize_for_comparison(normalized), for every word in KNOWN_WORDS
 RAHLFS_VERSE_MAP = {}   # verse_ref -> word_id
 SWETE_VERSE_MAP = {}    # verse_ref -> word_id
 RAHLFS_SORTED_VERSES = []  # [(verse_ref, word_id), ...] sorted by word_id
 SWETE_SORTED_VERSES = []   # [(verse_ref, word_id), ...] sorted by word_id
+RAHLFS_VERSE_INDEX = {}  # verse_ref -> position in RAHLFS_SORTED_VERSES
+SWETE_VERSE_INDEX = {}   # verse_ref -> position in SWETE_SORTED_VERSES
 ACCEPTED_WORDS = set()  # set of normalized accepted words
 ALREADY_EXAMINED = {}  # dict mapping (verse_ref, normalized_word) -> corrected_word
 
+# Bump when load_words_with_ids changes how words are normalized, so that
+# word caches written by older versions are rebuilt instead of reused
+WORD_CACHE_VERSION = 1
+
+# Precompiled regular expressions used on every line of the Bible file
+# \lettrine with \textcolor: \lettrine[...]{\textcolor{...}{Φ}}{ΙΛΟΣΟΦΩΤΑΤΟΝ}
+LETTRINE_TEXTCOLOR_PATTERN = re.compile(
+    r'\\lettrine\[[^\]]*\]\{\\textcolor\{[^}]+\}\{([^}]+)\}\}\{([^}]*)\}'
+)
+# \lettrine without \textcolor: \lettrine[...]{Κ}{ΑΙ}
+LETTRINE_SIMPLE_PATTERN = re.compile(r'\\lettrine\[[^\]]*\]\{([^}]+)\}\{([^}]*)\}')
+# LaTeX command with an optional {argument}, e.g. \vs{3} or \par
+LATEX_COMMAND_PATTERN = re.compile(r'\\[a-zA-Z]+(?:\{[^}]*\})?')
+# Greek range: \u0370-\u03FF (basic Greek), \u1F00-\u1FFF (extended Greek)
+GREEK_WORD_PATTERN = re.compile(r'[\u0370-\u03FF\u1F00-\u1FFF]+')
+# Book, chapter and verse markers, plus \lettrine (which starts chapter 1)
+MARKER_PATTERN = re.compile(
+    r'\\biblebook\{(?P<book>[^}]+)\}'
+    r'|\\ch\{(?P<chapter>\d+)\}'
+    r'|\\vs\{(?P<verse>\d+)\}'
+    r'|(?P<lettrine>\\lettrine)'
+)
+
 
+@lru_cache(maxsize=None)
 def normalize_text(text):
     """Normalize Greek text using NFC normalization."""
+    # ASCII is always NFC, and most of the Greek text is already NFC;
+    # either check avoids a copy
+    if text.isascii() or unicodedata.is_normalized("NFC", text):
+        return text
     return unicodedata.normalize("NFC", text)
 
 
+@lru_cache(maxsize=None)
 def strip_diacritics(text):
     """Remove diacritical marks and accents from Greek text."""
-    # First apply NFC normalization for consistency
-    text = normalize_text(text)
-    # Then decompose to NFD (separates base chars from combining marks)
-    text = unicodedata.normalize('NFD', text)
+    # ASCII text has no combining marks to remove
+    if text.isascii():
+        return text
+    # Decompose to NFD (separates base chars from combining marks).
+    # NFD(NFC(x)) == NFD(x), so no separate NFC pass is needed first.
+    if not unicodedata.is_normalized('NFD', text):
+        text = unicodedata.normalize('NFD', text)
     # Remove combining characters (accents, breathing marks, etc.)
-    stripped = ''.join(
-        char for char in text 
-        if unicodedata.category(char) != 'Mn'
-    )
+    stripped = text.translate(COMBINING_MARKS_TABLE)
     # Normalize back to NFC for consistent comparison
-    return unicodedata.normalize('NFC', stripped)
+    return normalize_text(stripped)
 
 
+@lru_cache(maxsize=None)
+def normalize_word(word):
+    """Return the lowercase, diacritic-stripped lookup key for a word.
+    Results are cached per unique token, since the same words recur
+    constantly in both the corpora and the Bible text.
+    """
+    return strip_diacritics(word.lower())
+
+
+@lru_cache(maxsize=1 << 16)
 def normalize_for_comparison(text):
     """Normalize text for comparison purposes.
     - Strips spaces (for compound word matching)
     - Replaces ς with σ when not at the end of the word
+    Cached, since the same verse and area words are compared against every
+    variation of every missing word nearby. The cache is bounded because
+    compound words and variations keep producing new strings.
     """
     # Remove spaces
     text = text.replace(' ', '')
     
-    # Replace ς with σ when it's not the last character
-    # Process from left to right, checking if ς is followed by more characters
-    result = []
-    for i, char in enumerate(text):
-        if char == 'ς' and i < len(text) - 1:
-            result.append('σ')
-        else:
-            result.append(char)
+    # Replace ς with σ when it's not the last character.
+    # Most words have no medial ς, and then there is nothing to rebuild
+    if 'ς' in text[:-1]:
+        text = text[:-1].replace('ς', 'σ') + text[-1]
     
-    return ''.join(result)
+    return text
+
+
+def get_comparison_form(normalized):
+    """Return normalize_for_comparison(normalized), using the precomputed
+    COMPARISON_FORMS for corpus words and computing it for anything else
+    (compound words, search terms).
+    """
+    comparison_form = COMPARISON_FORMS.get(normalized)
+    if comparison_form is None:
+        comparison_form = normalize_for_comparison(normalized)
+    return comparison_form
 
 
 def load_accepted_words(filepath):
@@ -81,7 +152,7 @@ def load_accepted_words(filepath):
                 word = line.strip()
                 if word and not word.startswith('#'):  # Skip empty lines and comments
                     # Normalize and strip diacritics for comparison
-                    normalized = strip_diacritics(normalize_text(word).lower())
+                    normalized = normalize_word(normalize_text(word))
                     words.add(normalized)
             print(f"Finished reading {filepath} ({line_count} lines, {len(words)} words loaded)")
     except FileNotFoundError:
@@ -109,7 +180,7 @@ def load_already_examined(filepath):
                     original_word = normalize_text(row[1].strip())
                     corrected_word = normalize_text(row[2].strip())
                     # Normalize and strip diacritics for comparison
-                    normalized_word = strip_diacritics(original_word.lower())
+                    normalized_word = normalize_word(original_word)
                     key = (verse_ref, normalized_word)
                     examined[key] = corrected_word
             print(f"Finished reading {filepath} ({row_count} rows, {len(examined)} word changes loaded)")
@@ -135,56 +206,127 @@ def derive_word_set(words_dict):
     return word_set
 
 
-def load_words_with_ids(filepath):
-    """Load words from CSV file with their word IDs for verse-specific lookups.
-    Returns dict mapping word_id -> {'normalized': str, 'original': str}.
+def read_words_with_ids(filepath):
+    """Read words from CSV file with their word IDs, like load_words_with_ids.
+    Returns (words_dict, complete), where complete is False if reading stopped
+    at an error and words_dict only holds the rows read before it.
     """
     print(f"Opening file with word IDs: {filepath}")
     words_dict = {}  # word_id -> {'normalized': word, 'original': word}
     try:
-        with open(filepath, 'r', encoding='utf-8') as f:
+        # Large read buffer; the word files are tens of MB
+        with open(filepath, 'r', encoding='utf-8', buffering=1 << 20) as f:
             print(f"Successfully opened {filepath}")
-            reader = csv.reader(f, delimiter='\t')
             row_count = 0
-            for row in reader:
+            # Plain tab-separated fields with no quoting, so a split is enough
+            for line in f:
+                row = line.rstrip('\r\n').split('\t')
                 row_count += 1
                 if len(row) >= 2:
                     word_id = int(row[0])
                     word = normalize_text(row[-1])
-                    normalized = strip_diacritics(word.lower())
+                    # Intern both forms so the many repeated words share one string object
+                    normalized = sys.intern(normalize_word(word))
                     words_dict[word_id] = {
                         'normalized': normalized,
-                        'original': word.lower()
+                        'original': sys.intern(word.lower())
                     }
             print(f"Finished reading {filepath} ({row_count} rows, {len(words_dict)} word IDs loaded)")
     except Exception as e:
         print(f"Error loading {filepath} with IDs: {e}")
+        return words_dict, False
+    return words_dict, True
+
+
+def load_words_with_ids(filepath):
+    """Load words from CSV file with their word IDs for verse-specific lookups.
+    Returns dict mapping word_id -> {'normalized': str, 'original': str}.
+    """
+    return read_words_with_ids(filepath)[0]
+
+
+def load_words_with_ids_cached(filepath):
+    """Load words with IDs like load_words_with_ids, using a pickle cache on disk.
+    The cache sits next to the source file and its name includes the source's
+    modification time and WORD_CACHE_VERSION, so editing the CSV or changing
+    the normalization invalidates it automatically.
+    """
+    try:
+        cache_path = f"{filepath}.{os.stat(filepath).st_mtime_ns}.v{WORD_CACHE_VERSION}.pkl"
+    except OSError:
+        return load_words_with_ids(filepath)
+    
+    if os.path.exists(cache_path):
+        print(f"Opening cached word IDs: {cache_path}")
+        try:
+            with open(cache_path, 'rb') as f:
+                words_dict = pickle.load(f)
+            print(f"Finished reading {cache_path} ({len(words_dict)} word IDs loaded)")
+            return words_dict
+        except Exception as e:
+            print(f"Error loading cache {cache_path}: {e}")
+    
+    words_dict, complete = read_words_with_ids(filepath)
+    # Only a clean, non-empty read is cached; a partial one would otherwise
+    # be reused silently until the CSV changes
+    if complete and words_dict:
+        # Remove caches left over from older versions of the source file;
+        # only names of the form <csv>.<mtime>.v<version>.pkl are touched
+        cache_name_pattern = re.compile(re.escape(os.path.basename(filepath)) + r'\.\d+\.v\d+\.pkl')
+        for stale_path in glob.glob(f"{glob.escape(filepath)}.*.pkl"):
+            if stale_path != cache_path and cache_name_pattern.fullmatch(os.path.basename(stale_path)):
+                try:
+                    os.remove(stale_path)
+                except OSError as e:
+                    print(f"Error removing old cache {stale_path}: {e}")
+        # Write to a temporary file first, so a concurrent run never reads a partial cache
+        temp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, 'wb') as f:
+                pickle.dump(words_dict, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, cache_path)
+            print(f"Saved word ID cache to {cache_path}")
+        except OSError as e:
+            print(f"Error saving cache {cache_path}: {e}")
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
     return words_dict
 
 
 def load_versification(filepath):
-    """Load versification file mapping verses to word IDs."""
+    """Load versification file mapping verses to word IDs.
+    Returns (verse_map, sorted_verses, verse_index): verse_ref -> word_id, the
+    (verse_ref, word_id) pairs sorted by word_id, and verse_ref -> position
+    in sorted_verses.
+    """
     print(f"Opening versification file: {filepath}")
     verse_map = {}  # verse_ref -> word_id
     try:
         with open(filepath, 'r', encoding='utf-8') as f:
             print(f"Successfully opened {filepath}")
-            reader = csv.reader(f, delimiter='\t')
             row_count = 0
-            for row in reader:
+            # Rahlfs: verse_ref, word_id
+            # Swete: word_id, verse_ref
+            # The order is fixed per file, so it is detected on the first row only
+            word_id_first = None
+            for line in f:
+                row = line.rstrip('\r\n').split('\t')
                 row_count += 1
                 if len(row) >= 2:
-                    # Rahlfs: verse_ref, word_id
-                    # Swete: word_id, verse_ref
-                    # Detect format by checking if first column is numeric
-                    try:
-                        word_id = int(row[0])
-                        verse_ref = row[1]
-                    except ValueError:
+                    if word_id_first is None:
+                        # Detect format by checking if first column is numeric
+                        try:
+                            int(row[0])
+                            word_id_first = True
+                        except ValueError:
+                            word_id_first = False
+                    if word_id_first:
+                        verse_map[row[1]] = int(row[0])
+                    else:
                         # First column is verse ref, second is word_id
-                        verse_ref = row[0]
-                        word_id = int(row[1])
-                    verse_map[verse_ref] = word_id
+                        verse_map[row[0]] = int(row[1])
             print(f"Finished reading {filepath} ({row_count} rows, {len(verse_map)} verses loaded)")
     except Exception as e:
         print(f"Error loading {filepath}: {e}")
@@ -193,7 +335,23 @@ def load_versification(filepath):
     print(f"Sorting verses from {filepath}...")
     sorted_verses = sorted(verse_map.items(), key=lambda x: x[1])
     print(f"Finished sorting {len(sorted_verses)} verses")
-    return verse_map, sorted_verses
+    # Position of each verse in the sorted list, so lookups need no scan
+    verse_index = {verse_ref: i for i, (verse_ref, _) in enumerate(sorted_verses)}
+    return verse_map, sorted_verses, verse_index
+
+
+def is_word_known(word, verse_ref):
+    """Check if a word needs no further review: it is an accepted word, it was
+    already examined in this verse, or it exists in the word sets.
+    Uses global ACCEPTED_WORDS, ALREADY_EXAMINED and KNOWN_WORD_FORMS.
+    """
+    normalized_word = normalize_word(word)
+    if normalized_word in ACCEPTED_WORDS:
+        return True
+    # Only words in a fully known verse can have been examined there
+    if verse_ref != "Unknown" and (verse_ref, normalized_word) in ALREADY_EXAMINED:
+        return True
+    return is_word_in_sets(normalized_word)
 
 
 def extract_greek_words(line):
@@ -205,14 +363,15 @@ def extract_greek_words(line):
     # 1. With \textcolor: \lettrine[...]{\textcolor{...}{Φ}}{ΙΛΟΣΟΦΩΤΑΤΟΝ}
     # 2. Without \textcolor: \lettrine[...]{Κ}{ΑΙ}
     
-    # Try pattern with \textcolor first (more specific)
-    lettrine_pattern_textcolor = r'\\lettrine\[[^\]]*\]\{\\textcolor\{[^}]+\}\{([^}]+)\}\}\{([^}]*)\}'
-    lettrine_match = re.search(lettrine_pattern_textcolor, line)
-    
-    if not lettrine_match:
-        # Try simple pattern without \textcolor
-        lettrine_pattern_simple = r'\\lettrine\[[^\]]*\]\{([^}]+)\}\{([^}]*)\}'
-        lettrine_match = re.search(lettrine_pattern_simple, line)
+    # Only a handful of lines contain \lettrine, so skip both searches otherwise
+    lettrine_match = None
+    if '\\lettrine' in line:
+        # Try pattern with \textcolor first (more specific)
+        lettrine_match = LETTRINE_TEXTCOLOR_PATTERN.search(line)
+        
+        if not lettrine_match:
+            # Try simple pattern without \textcolor
+            lettrine_match = LETTRINE_SIMPLE_PATTERN.search(line)
     
     if lettrine_match:
         # Extract the first character
@@ -233,15 +392,11 @@ def extract_greek_words(line):
         line = line[:lettrine_match.start()] + line[lettrine_match.end():]
     
     # Remove remaining LaTeX commands and their contents
-    line = re.sub(r'\\[a-zA-Z]+\{[^}]*\}', '', line)
-    line = re.sub(r'\\[a-zA-Z]+', '', line)
+    line = LATEX_COMMAND_PATTERN.sub('', line)
     
-    # Match Greek words (unicode Greek range)
-    # Greek range: \u0370-\u03FF (basic Greek), \u1F00-\u1FFF (extended Greek)
-    greek_pattern = r'[\u0370-\u03FF\u1F00-\u1FFF]+'
-    remaining_words = re.findall(greek_pattern, line)
-    
-    words.extend([normalize_text(word) for word in remaining_words])
+    # Match Greek words (unicode Greek range); findall and map keep the
+    # per-word work in C, with normalize_text answered from its cache
+    words.extend(map(normalize_text, GREEK_WORD_PATTERN.findall(line)))
     
     return words
 
@@ -252,38 +407,72 @@ def is_likely_proper_name(word):
     return len(word) > 0 and word[0].isupper()
 
 
+# Greek number words often contain these patterns (lowercase, diacritics stripped)
+NUMBER_PATTERNS = tuple(strip_diacritics(pattern) for pattern in [
+    'ἑκατό', 'χίλι', 'μύρι',  # hundred, thousand, myriad
+    'δέκα', 'εἴκοσι', 'τριάκοντα', 'τεσσαράκοντα', 'πεντήκοντα',
+    'ἑξήκοντα', 'ἑβδομήκοντα', 'ὀγδοήκοντα', 'ἐνενήκοντα', 'ἐννενήκοντα', 'ἐννεήκοντα',
+    'πρῶτο', 'δεύτερο', 'τρίτο', 'τέταρτο', 'πέμπτο',
+    'διακόσι', 'τριακόσι', 'τετρακόσι', 'πεντακόσι', 'ἑξακόσι', 'ἑπτακόσι', 'ὀκτακόσι', 'ἐννακόσι'
+])
+
+
+def build_trie_pattern(words):
+    """Build a regex source matching any of the given words, with shared
+    prefixes factored out (e.g. 'τρι(?:ακο(?:ντα|σι)|το)').
+    The regex engine then rejects most positions after one character,
+    giving a single Aho-Corasick-style pass instead of one scan per word.
+    """
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}  # end of a word
+    
+    def to_pattern(node):
+        # A word ending here already matches; longer words add nothing to a search
+        if '' in node:
+            return ''
+        alternatives = [re.escape(char) + to_pattern(child) for char, child in sorted(node.items())]
+        if len(alternatives) == 1:
+            return alternatives[0]
+        return '(?:' + '|'.join(alternatives) + ')'
+    
+    # No words: match nothing, like any() over an empty list
+    # (an empty alternation would match everywhere)
+    if not trie:
+        return '(?!)'
+    return to_pattern(trie)
+
+
+# All NUMBER_PATTERNS in one search
+NUMBER_PATTERN = re.compile(build_trie_pattern(NUMBER_PATTERNS))
+
+
+@lru_cache(maxsize=None)
 def is_likely_number_word(word):
-    """Check if word appears to be a number/numeral."""
-    # Greek number words often contain these patterns
-    number_patterns = [
-        'ἑκατό', 'χίλι', 'μύρι',  # hundred, thousand, myriad
-        'δέκα', 'εἴκοσι', 'τριάκοντα', 'τεσσαράκοντα', 'πεντήκοντα',
-        'ἑξήκοντα', 'ἑβδομήκοντα', 'ὀγδοήκοντα', 'ἐνενήκοντα', 'ἐννενήκοντα', 'ἐννεήκοντα',
-        'πρῶτο', 'δεύτερο', 'τρίτο', 'τέταρτο', 'πέμπτο',
-        'διακόσι', 'τριακόσι', 'τετρακόσι', 'πεντακόσι', 'ἑξακόσι', 'ἑπτακόσι', 'ὀκτακόσι', 'ἐννακόσι'
-    ]
-    word_lower = word.lower()
-    word_stripped = strip_diacritics(word_lower)
-    
-    for pattern in number_patterns:
-        pattern_stripped = strip_diacritics(pattern.lower())
-        if pattern_stripped in word_stripped:
-            return True
-    return False
-
-
-def find_closest_word(word, word_dict):
+    """Check if word appears to be a number/numeral.
+    Cached per token, so a word missing on many lines is classified once.
+    """
+    return NUMBER_PATTERN.search(normalize_word(word)) is not None
+
+
+def find_closest_word(normalized, word_dict, length_index=None):
     """Find the closest matching word in the dict within max_distance edits.
     word_dict maps normalized -> original (with diacritics).
     Returns the original word with diacritics.
     
     Args:
-        word: The word to match
+        normalized: The word to match, already lowercased and diacritic-stripped
         word_dict: Dictionary mapping normalized -> original words
+        length_index: Optional build_length_index(word_dict) result, for large dicts
     """
-    normalized = strip_diacritics(word.lower())
-
-    best_match_normalized, best_ratio = find_best_match(word_dict, normalized)
+    # Candidates that cannot reach the 0.80 threshold are skipped unscored.
+    # An exact key scores 1.0, so then only other perfect scores (equal
+    # comparison forms) can compete with it for the earliest position
+    min_ratio = 1.0 if normalized in word_dict else 0.80
+    best_match_normalized, best_ratio = find_best_match(word_dict, normalized, 0, length_index, min_ratio)
     
     # Return match only if it's very close (likely a typo)
     if best_ratio >= 0.80 and best_match_normalized:
@@ -295,7 +484,7 @@ def find_closest_word(word, word_dict):
         if normalized.endswith('ε') or normalized.endswith('ι'):
             normalized_with_nu = normalized + 'ν'
 
-            best_match_normalized, best_ratio = find_best_match(word_dict, normalized_with_nu, best_ratio)            
+            best_match_normalized, best_ratio = find_best_match(word_dict, normalized_with_nu, best_ratio, length_index, 0.80)
             
             # Check if adding ν improved the match to above threshold
             if best_ratio >= 0.80 and best_match_normalized:
@@ -303,26 +492,156 @@ def find_closest_word(word, word_dict):
     
     return None, 0
 
-def find_best_match(word_dict, normalized, current_best_ratio = 0):
+@lru_cache(maxsize=1 << 16)
+def get_character_counts(text):
+    """Return a dict mapping each character of text to its number of occurrences.
+    Cached, since the same vocabulary words are scored against many queries.
+    The cache is bounded because verse and area compound words also pass
+    through here and keep producing new strings.
+    """
+    counts = {}
+    for char in text:
+        counts[char] = counts.get(char, 0) + 1
+    return counts
+
+
+def build_length_index(word_dict):
+    """Group the words of a large word dict by the length of their comparison form.
+    Returns dict mapping length -> [(position, normalized, comparison_form), ...],
+    where position is the word's place in word_dict's iteration order.
+    """
+    length_index = {}
+    for position, candidate_normalized in enumerate(word_dict):
+        candidate_for_comp = get_comparison_form(candidate_normalized)
+        length_index.setdefault(len(candidate_for_comp), []).append(
+            (position, candidate_normalized, candidate_for_comp))
+    return length_index
+
+
+def shared_character_bound(target_counts, candidate_for_comp, total_len):
+    """Upper bound on SequenceMatcher.ratio() from the characters two strings share.
+    This is the value quick_ratio() computes, but with both character counts cached.
+    target_counts is get_character_counts(target).items(), and total_len the sum
+    of both lengths.
+    """
+    # Two empty strings have a ratio of 1
+    if not total_len:
+        return 1.0
+    candidate_counts = get_character_counts(candidate_for_comp)
+    shared = 0
+    for char, count in target_counts:
+        candidate_count = candidate_counts.get(char)
+        if candidate_count:
+            shared += count if count < candidate_count else candidate_count
+    return 2.0 * shared / total_len
+
+
+def cannot_beat(bound, position, best_ratio, best_position, min_ratio):
+    """Check whether a candidate whose ratio is at most bound can be skipped.
+    It can if it cannot reach min_ratio, or cannot beat best_ratio; ties go to
+    the earliest position, and best_position -1 means a tie never replaces
+    the starting ratio.
+    """
+    return bound < min_ratio or bound < best_ratio or (
+        bound == best_ratio and position > best_position)
+
+
+def find_best_indexed_match(length_index, normalized, current_best_ratio=0, min_ratio=0):
+    """find_best_match over a build_length_index() result.
+    Length groups are searched closest length first, so a good match is found
+    early and whole groups can then be skipped on the length bound alone.
+    Ties go to the earliest position, so the result is the same as scanning
+    the word dict in order.
+    Candidates whose upper bound is below min_ratio are never scored.
+    """
+    normalized_for_comp = get_comparison_form(normalized)
+    target_len = len(normalized_for_comp)
+    target_counts = get_character_counts(normalized_for_comp).items()
+    
+    matcher = SequenceMatcher(None, normalized_for_comp)
+    best_match_normalized = None
+    best_position = -1
+    for length_offset in (0, -1, 1, -2, 2):
+        candidate_len = target_len + length_offset
+        candidates = length_index.get(candidate_len)
+        if not candidates:
+            continue
+        
+        # ratio() never exceeds 2*min(len)/sum(len), the same for the whole group;
+        # positions ascend within a group, so its first one decides ties
+        total_len = candidate_len + target_len
+        length_bound = 2.0 * min(candidate_len, target_len) / total_len if total_len else 1.0
+        if cannot_beat(length_bound, candidates[0][0], current_best_ratio, best_position, min_ratio):
+            continue
+        
+        for position, candidate_normalized, candidate_for_comp in candidates:
+            bound = shared_character_bound(target_counts, candidate_for_comp, total_len)
+            if cannot_beat(bound, position, current_best_ratio, best_position, min_ratio):
+                continue
+            
+            matcher.set_seq2(candidate_for_comp)
+            ratio = matcher.ratio()
+            if ratio > current_best_ratio or (
+                    ratio == current_best_ratio and position < best_position):
+                current_best_ratio = ratio
+                best_match_normalized = candidate_normalized
+                best_position = position
+                # A perfect score only occurs at equal length, and positions
+                # ascend within a group, so nothing later can win or tie earlier
+                if ratio == 1.0:
+                    return best_match_normalized, current_best_ratio
+    return best_match_normalized, current_best_ratio
+
+
+def find_best_match(word_dict, normalized, current_best_ratio = 0, length_index=None, min_ratio=0):
+    if length_index is not None:
+        return find_best_indexed_match(length_index, normalized, current_best_ratio, min_ratio)
+    
     # Only check words of similar length (within 2 characters)
     # Normalize the search term for comparison
-    normalized_for_comp = normalize_for_comparison(normalized)
+    normalized_for_comp = get_comparison_form(normalized)
     target_len = len(normalized_for_comp)
+    target_counts = get_character_counts(normalized_for_comp).items()
     
+    # One matcher for the search term; only the candidate changes per iteration
+    matcher = SequenceMatcher(None, normalized_for_comp)
     best_match_normalized = None
-    for candidate_normalized in word_dict.keys():
+    best_position = -1
+    # Candidates arrive in dict order, so the same tie rule as
+    # find_best_indexed_match keeps the earliest of equally good words
+    for position, candidate_normalized in enumerate(word_dict):
         # Normalize candidate for comparison (handles spaces and ς/σ)
-        candidate_for_comp = normalize_for_comparison(candidate_normalized)
-        if abs(len(candidate_for_comp) - target_len) > 2:
+        candidate_for_comp = get_comparison_form(candidate_normalized)
+        candidate_len = len(candidate_for_comp)
+        if abs(candidate_len - target_len) > 2:
+            continue
+        
+        # ratio() never exceeds 2*min(len)/sum(len) (the real_quick_ratio bound),
+        # so skip candidates that cannot beat the current best on length alone
+        # (or that could never reach min_ratio, the caller's acceptance threshold)
+        total_len = candidate_len + target_len
+        length_bound = 2.0 * min(candidate_len, target_len) / total_len if total_len else 1.0
+        if cannot_beat(length_bound, position, current_best_ratio, best_position, min_ratio):
+            continue
+        
+        # Shared characters give a cheaper, tighter upper bound
+        bound = shared_character_bound(target_counts, candidate_for_comp, total_len)
+        if cannot_beat(bound, position, current_best_ratio, best_position, min_ratio):
             continue
             
         # Calculate similarity ratio
-        ratio = SequenceMatcher(None, normalized_for_comp, candidate_for_comp).ratio()
+        matcher.set_seq2(candidate_for_comp)
+        ratio = matcher.ratio()
         
         # If very similar (>0.8 similarity), it might be a typo
-        if ratio > current_best_ratio:
+        if ratio > current_best_ratio or (
+                ratio == current_best_ratio and position < best_position):
             current_best_ratio = ratio
             best_match_normalized = candidate_normalized
+            best_position = position
+            # Nothing can score above a perfect match
+            if ratio == 1.0:
+                break
     return best_match_normalized,current_best_ratio
 
 
@@ -342,16 +661,15 @@ def get_words_by_id_range(start_word_id, end_word_id, words_dict):
     words_in_order = []
     
     # Extract words in this ID range and track order
+    # (one dict probe per ID; most IDs in a verse range are present)
     for word_id in range(start_word_id, end_word_id + 1):
-        if word_id in words_dict:
-            word_data = words_dict[word_id]
+        word_data = words_dict.get(word_id)
+        if word_data is not None:
             result_words[word_data['normalized']] = word_data['original']
             words_in_order.append(word_data)
     
     # Add compound combinations of consecutive words
-    for i in range(len(words_in_order) - 1):
-        word1 = words_in_order[i]
-        word2 = words_in_order[i + 1]
+    for word1, word2 in zip(words_in_order, words_in_order[1:]):
         combined_normalized = word1['normalized'] + word2['normalized']
         # Preserve space in the original form
         combined_original = word1['original'] + ' ' + word2['original']
@@ -360,52 +678,45 @@ def get_words_by_id_range(start_word_id, end_word_id, words_dict):
     return result_words
 
 
-def get_verse_words(verse_ref, verse_map, sorted_verses, words_dict):
+def get_verse_words(verse_ref, verse_index, sorted_verses, words_dict, max_word_id=None):
     """Get all words for a specific verse using the versification mapping.
+    verse_index maps verse_ref -> position in sorted_verses (from load_versification).
     words_dict maps word_id -> {'normalized': str, 'original': str}.
+    max_word_id is the highest word_id in words_dict (computed if not given).
     Returns dict mapping normalized -> original for words in this verse.
     Also includes compound combinations of consecutive words (e.g., word1+word2).
     NOTE: This helper still takes parameters since it's used internally with different data sources.
     """
-    # Find start word ID for this verse
-    if verse_ref not in verse_map:
+    # Find this verse in the pre-sorted list
+    current_idx = verse_index.get(verse_ref)
+    if current_idx is None:
         return {}
     
-    start_id = verse_map[verse_ref]
-    
-    # Find the next verse to get end boundary using pre-sorted list
-    current_idx = None
-    for i, (v_ref, v_id) in enumerate(sorted_verses):
-        if v_ref == verse_ref:
-            current_idx = i
-            break
+    # Start word ID for this verse
+    start_id = sorted_verses[current_idx][1]
     
-    # Determine end ID
-    if current_idx is not None and current_idx + 1 < len(sorted_verses):
+    # Determine end ID from the next verse
+    if current_idx + 1 < len(sorted_verses):
         end_id = sorted_verses[current_idx + 1][1] - 1
     else:
         # Last verse - use maximum word ID
-        end_id = max(words_dict.keys()) if words_dict else start_id
+        if max_word_id is None:
+            max_word_id = max(words_dict.keys()) if words_dict else start_id
+        end_id = max_word_id
     
     return get_words_by_id_range(start_id, end_id, words_dict)
 
 
-def get_area_words(verse_ref, verse_map, sorted_verses, words_dict, verse_range=20):
+def get_area_words(verse_ref, verse_index, sorted_verses, words_dict, verse_range=20, max_word_id=None):
     """Get all words from surrounding verses (±verse_range verses).
+    verse_index maps verse_ref -> position in sorted_verses (from load_versification).
     words_dict maps word_id -> {'normalized': str, 'original': str}.
+    max_word_id is the highest word_id in words_dict (computed if not given).
     Returns dict mapping normalized -> original for words in this area.
     Also includes compound combinations of consecutive words (e.g., word1+word2).
     """
     # Find the current verse index in sorted list
-    if verse_ref not in verse_map:
-        return {}
-    
-    current_idx = None
-    for i, (v_ref, v_id) in enumerate(sorted_verses):
-        if v_ref == verse_ref:
-            current_idx = i
-            break
-    
+    current_idx = verse_index.get(verse_ref)
     if current_idx is None:
         return {}
     
@@ -420,7 +731,9 @@ def get_area_words(verse_ref, verse_map, sorted_verses, words_dict, verse_range=
     if end_verse_idx + 1 < len(sorted_verses):
         end_word_id = sorted_verses[end_verse_idx + 1][1] - 1
     else:
-        end_word_id = max(words_dict.keys()) if words_dict else start_word_id
+        if max_word_id is None:
+            max_word_id = max(words_dict.keys()) if words_dict else start_word_id
+        end_word_id = max_word_id
     
     return get_words_by_id_range(start_word_id, end_word_id, words_dict)
 
@@ -469,14 +782,17 @@ def has_legitimate_variation_in_verse(word, verse_words):
     # Generate all legitimate variations of the word
     variations = generate_variation_list(word, "all")
     
+    # Normalize the verse words for comparison once (handles spaces and ς/σ),
+    # keeping the first word for each form as a scan in order would find it
+    verse_forms = {}
+    for normalized_key, original_value in verse_words.items():
+        verse_forms.setdefault(get_comparison_form(normalized_key), original_value)
+    
     # Check if any variation exists in the verse words
-    # Normalize both for comparison (handles spaces and ς/σ)
     for variation in variations:
-        variation_normalized = normalize_for_comparison(variation)
-        for normalized_key, original_value in verse_words.items():
-            key_normalized = normalize_for_comparison(normalized_key)
-            if variation_normalized == key_normalized:
-                return True, original_value, len(variations)
+        original_value = verse_forms.get(normalize_for_comparison(variation))
+        if original_value is not None:
+            return True, original_value, len(variations)
     
     return False, None, len(variations)
 
@@ -491,9 +807,10 @@ def check_legitimate_variations_in_scope(word, rahlfs_words, swete_words):
     return check_words_in_both_sources(word, rahlfs_words, swete_words, has_legitimate_variation_in_verse)
 
 
-def check_typos_in_scope(word, rahlfs_words, swete_words):
+def check_typos_in_scope(normalized, rahlfs_words, swete_words):
     """
     Check for typos in both Rahlfs and Swete word sources.
+    Takes the normalized (lowercase, diacritic-stripped) form of the word.
     
     Returns:
         (found, matched_word, similarity_ratio) tuple
@@ -503,9 +820,51 @@ def check_typos_in_scope(word, rahlfs_words, swete_words):
         found = ratio >= 0.80
         return found, closest, ratio
     
-    return check_words_in_both_sources(word, rahlfs_words, swete_words, find_typo)
+    return check_words_in_both_sources(normalized, rahlfs_words, swete_words, find_typo)
+
+
+@lru_cache(maxsize=None)
+def find_typo_in_corpus(normalized):
+    """Check a normalized word for typos against the whole of both corpora.
+    The result depends only on the normalized form, so it is computed once per
+    unique token; a word missing on many lines costs a single corpus scan.
+    Returns (found, matched_word, similarity_ratio) tuple
+    """
+    def find_typo(w, corpus):
+        word_dict, length_index = corpus
+        closest, ratio = find_closest_word(w, word_dict, length_index)
+        found = ratio >= 0.80
+        return found, closest, ratio
+    
+    return check_words_in_both_sources(normalized,
+                                       (RAHLFS_WORDS, RAHLFS_LENGTH_INDEX),
+                                       (SWETE_WORDS, SWETE_LENGTH_INDEX),
+                                       find_typo)
+
+
+@lru_cache(maxsize=32)
+def get_scope_words(brenton_book, brenton_ch, brenton_vs, verse_range=0):
+    """Get the Rahlfs and Swete words for a Brenton verse, or with verse_range > 0
+    for the ±verse_range verses around it.
+    Missing words arrive in file order, so consecutive words in the same verse
+    share one lookup instead of rebuilding the same dicts.
+    Returns (rahlfs_words, swete_words) dicts mapping normalized -> original;
+    the cached dicts must not be modified.
+    """
+    rahlfs_ref = convert_brenton_reference_to_rahlfs(brenton_book, brenton_ch, brenton_vs)
+    swete_ref = convert_brenton_reference_to_swete(brenton_book, brenton_ch, brenton_vs)
+    if verse_range:
+        return (get_area_words(rahlfs_ref, RAHLFS_VERSE_INDEX, RAHLFS_SORTED_VERSES, RAHLFS_WORDS_DICT,
+                               verse_range, RAHLFS_MAX_WORD_ID),
+                get_area_words(swete_ref, SWETE_VERSE_INDEX, SWETE_SORTED_VERSES, SWETE_WORDS_DICT,
+                               verse_range, SWETE_MAX_WORD_ID))
+    return (get_verse_words(rahlfs_ref, RAHLFS_VERSE_INDEX, RAHLFS_SORTED_VERSES, RAHLFS_WORDS_DICT,
+                            RAHLFS_MAX_WORD_ID),
+            get_verse_words(swete_ref, SWETE_VERSE_INDEX, SWETE_SORTED_VERSES, SWETE_WORDS_DICT,
+                            SWETE_MAX_WORD_ID))
 
 
+@lru_cache(maxsize=None)
 def is_likely_typo(word, brenton_book=None, brenton_ch=None, brenton_vs=None):
     """
     Check if word is likely a typo by finding very similar words.
@@ -513,22 +872,22 @@ def is_likely_typo(word, brenton_book=None, brenton_ch=None, brenton_vs=None):
     First checks verse-specific words for legitimate variations, then exact matches,
     then area (±20 verses), then falls back to broader corpus.
     Compound words are automatically checked since get_verse_words includes them.
+    Results are cached per word and verse, so a word repeated within a verse
+    is only checked once; the broad corpus search is cached per word as well.
     Returns (is_typo, closest_match, similarity_ratio, verse_match, area_match, legitimate_variation)
     """
     verse_match = False
     area_match = False
     legitimate_variation = False
+    # Strip once; the typo searches below all work on the normalized form
+    normalized = normalize_word(word)
     
     # First try verse-specific search if we have the necessary data
     if all([brenton_book, brenton_ch, brenton_vs, RAHLFS_VERSE_MAP, SWETE_VERSE_MAP, 
             RAHLFS_SORTED_VERSES, SWETE_SORTED_VERSES,
             RAHLFS_WORDS_DICT, SWETE_WORDS_DICT]):
         try:
-            rahlfs_ref = convert_brenton_reference_to_rahlfs(brenton_book, brenton_ch, brenton_vs)
-            swete_ref = convert_brenton_reference_to_swete(brenton_book, brenton_ch, brenton_vs)
-            
-            rahlfs_verse_words = get_verse_words(rahlfs_ref, RAHLFS_VERSE_MAP, RAHLFS_SORTED_VERSES, RAHLFS_WORDS_DICT)
-            swete_verse_words = get_verse_words(swete_ref, SWETE_VERSE_MAP, SWETE_SORTED_VERSES, SWETE_WORDS_DICT)
+            rahlfs_verse_words, swete_verse_words = get_scope_words(brenton_book, brenton_ch, brenton_vs)
             
             if rahlfs_verse_words or swete_verse_words:
                 # Check for legitimate spelling variations in the verse
@@ -539,14 +898,13 @@ def is_likely_typo(word, brenton_book=None, brenton_ch=None, brenton_vs=None):
                     return False, best_match, 1.0, True, False, True
                 
                 # Check verse-specific words for typos
-                is_typo, best_match, best_ratio = check_typos_in_scope(word, rahlfs_verse_words, swete_verse_words)
+                is_typo, best_match, best_ratio = check_typos_in_scope(normalized, rahlfs_verse_words, swete_verse_words)
                 
                 if is_typo:
                     return True, best_match, best_ratio, True, False, False
             
             # If not found in exact verse, check surrounding area (±20 verses)
-            rahlfs_area_words = get_area_words(rahlfs_ref, RAHLFS_VERSE_MAP, RAHLFS_SORTED_VERSES, RAHLFS_WORDS_DICT, verse_range=20)
-            swete_area_words = get_area_words(swete_ref, SWETE_VERSE_MAP, SWETE_SORTED_VERSES, SWETE_WORDS_DICT, verse_range=20)
+            rahlfs_area_words, swete_area_words = get_scope_words(brenton_book, brenton_ch, brenton_vs, verse_range=20)
             
             if rahlfs_area_words or swete_area_words:
                 # Check for legitimate variations in the area
@@ -557,7 +915,7 @@ def is_likely_typo(word, brenton_book=None, brenton_ch=None, brenton_vs=None):
                     return False, best_match, 1.0, False, True, True
                 
                 # Check area words for typos
-                is_typo, best_match, best_ratio = check_typos_in_scope(word, rahlfs_area_words, swete_area_words)
+                is_typo, best_match, best_ratio = check_typos_in_scope(normalized, rahlfs_area_words, swete_area_words)
                 
                 if is_typo:
                     return True, best_match, best_ratio, False, True, False
@@ -566,87 +924,129 @@ def is_likely_typo(word, brenton_book=None, brenton_ch=None, brenton_vs=None):
             pass
     
     # Fall back to broad corpus search - use pre-derived global word sets
-    is_typo, best_match, best_ratio = check_typos_in_scope(word, RAHLFS_WORDS, SWETE_WORDS)
+    is_typo, best_match, best_ratio = find_typo_in_corpus(normalized)
     
     if is_typo:
         return True, best_match, best_ratio, False, False, False
     return False, None, 0, False, False, False
 
 
-def is_word_in_sets(word):
-    """Check if word exists in either word dict (case-insensitive, diacritic-stripped).
-    Uses global RAHLFS_WORDS and SWETE_WORDS (pre-derived normalized->original mappings).
+@lru_cache(maxsize=None)
+def is_word_in_sets(normalized):
+    """Check if a normalized (lowercase, diacritic-stripped) word exists in either word dict.
+    Uses global KNOWN_WORD_FORMS (the combined normalized words of RAHLFS_WORDS and
+    SWETE_WORDS, plus their movable-ν stems).
+    Results are cached per token, since the set is fixed once loaded.
     """
-    normalized = strip_diacritics(word.lower())
-    
-    # First, try the word as-is
-    if normalized in RAHLFS_WORDS or normalized in SWETE_WORDS:
-        return True
-    
-    # Second, try with movable ν added at the end
-    # This handles cases where Brenton drops the movable nu
-    normalized_with_nu = normalized + 'ν'
-    if normalized_with_nu in RAHLFS_WORDS or normalized_with_nu in SWETE_WORDS:
-        return True
-    
-    return False
+    # The word as-is, or with a movable ν added at the end (Brenton sometimes
+    # drops the movable nu); both forms are in the one precomputed set
+    return normalized in KNOWN_WORD_FORMS
 
 
-def extract_book_name(line):
-    """Extract book name from \\biblebook{...} command."""
-    match = re.search(r'\\biblebook\{([^}]+)\}', line)
-    if match:
-        return normalize_text(match.group(1))
-    return None
+def scan_markers(text):
+    """Find book, chapter and verse markers in a single pass over the whole text.
+    Returns dict mapping line number -> {'book': str, 'chapter': int, 'verse': int,
+    'lettrine': True}, holding the first marker of each kind found on that line.
+    """
+    markers = {}
+    line_num = 1
+    last_pos = 0
+    for match in MARKER_PATTERN.finditer(text):
+        # Advance the line counter to the line containing this match
+        line_num += text.count('\n', last_pos, match.start())
+        last_pos = match.start()
+        line_markers = markers.setdefault(line_num, {})
+        kind = match.lastgroup
+        if kind == 'book':
+            line_markers.setdefault('book', normalize_text(match.group('book')))
+        elif kind == 'lettrine':
+            line_markers.setdefault('lettrine', True)
+        else:
+            line_markers.setdefault(kind, int(match.group(kind)))
+    return markers
 
 
-def extract_chapter_number(line):
-    """Extract chapter number from \\ch{...} or \\lettrine lines."""
-    # Check for regular chapter command
-    match = re.search(r'\\ch\{(\d+)\}', line)
-    if match:
-        return int(match.group(1))
-    
-    # Check for lettrine (first chapter, starts with chapter 1)
-    if r'\lettrine' in line:
-        return 1
-    
-    return None
+def classify_missing_word(missing_word):
+    """Run the name, number and typo checks for one missing word, given as a
+    (line_num, verse_ref, word, line, book, chapter, verse) tuple from iter_missing_words.
+    Returns (is_name, is_number, typo_result) where typo_result is the tuple
+    returned by is_likely_typo.
+    """
+    _, _, word, _, brenton_book, brenton_ch, brenton_vs = missing_word
+    return (is_likely_proper_name(word),
+            is_likely_number_word(word),
+            is_likely_typo(word, brenton_book, brenton_ch, brenton_vs))
 
 
-def extract_verse_number(line):
-    """Extract verse number from \\vs{...} command."""
-    match = re.search(r'\\vs\{(\d+)\}', line)
-    if match:
-        return int(match.group(1))
-    return None
+def get_worker_state():
+    """Collect the loaded word and versification data that typo checking needs."""
+    return {
+        'RAHLFS_WORDS_DICT': RAHLFS_WORDS_DICT,
+        'SWETE_WORDS_DICT': SWETE_WORDS_DICT,
+        'RAHLFS_MAX_WORD_ID': RAHLFS_MAX_WORD_ID,
+        'SWETE_MAX_WORD_ID': SWETE_MAX_WORD_ID,
+        'RAHLFS_WORDS': RAHLFS_WORDS,
+        'SWETE_WORDS': SWETE_WORDS,
+        'COMPARISON_FORMS': COMPARISON_FORMS,
+        'RAHLFS_LENGTH_INDEX': RAHLFS_LENGTH_INDEX,
+        'SWETE_LENGTH_INDEX': SWETE_LENGTH_INDEX,
+        'RAHLFS_VERSE_MAP': RAHLFS_VERSE_MAP,
+        'SWETE_VERSE_MAP': SWETE_VERSE_MAP,
+        'RAHLFS_SORTED_VERSES': RAHLFS_SORTED_VERSES,
+        'SWETE_SORTED_VERSES': SWETE_SORTED_VERSES,
+        'RAHLFS_VERSE_INDEX': RAHLFS_VERSE_INDEX,
+        'SWETE_VERSE_INDEX': SWETE_VERSE_INDEX,
+    }
 
 
-def process_bible_file(bible_path, output_path, check_typos=True):
-    """Process the Bible file and log missing words.
-    Uses global data structures (RAHLFS_WORDS_DICT, SWETE_WORDS_DICT, ACCEPTED_WORDS, etc.).
+def init_worker(state):
+    """Install the loaded data as module globals in a worker process."""
+    globals().update(state)
+
+
+def create_worker_pool(jobs):
+    """Create a process pool for typo checking.
+    On Linux the 'fork' start method lets workers inherit the loaded data
+    without it being pickled. Other platforms keep their default start method
+    (macOS defaults to 'spawn' because forking is unsafe with its system
+    libraries), and the initializer installs a copy of the data.
+    """
+    start_method = 'fork' if sys.platform.startswith('linux') else None
+    return ProcessPoolExecutor(max_workers=jobs,
+                               mp_context=multiprocessing.get_context(start_method),
+                               initializer=init_worker,
+                               initargs=(get_worker_state(),))
+
+
+def open_tsv_writer(stack, path, header):
+    """Open a TSV file for writing on the given ExitStack and write its header row.
+    Returns the csv writer.
+    """
+    print(f"Opening file for writing: {path}")
+    # Large write buffer so streamed rows reach the disk in big chunks
+    f = stack.enter_context(open(path, 'w', encoding='utf-8', newline='', buffering=1 << 20))
+    print(f"Successfully opened {path} for writing")
+    writer = csv.writer(f, delimiter='\t')
+    writer.writerow(header)
+    return writer
+
+
+def iter_missing_words(lines, markers):
+    """Yield every Greek word in lines that is not known, in file order.
+    Tracks the current book, chapter and verse from the markers found by scan_markers.
+    Yields (line_num, verse_ref, word, line, book, chapter, verse) tuples.
     """
-    
     current_book = None
     current_chapter = None
     current_verse = None
     
-    missing_words = []
-    words_checked = 0
-    typos_found = 0
-    
-    print("Processing Bible file...")
-    if not check_typos:
-        print("Typo checking disabled for faster processing.")
-    
-    print(f"Opening Bible file for reading: {bible_path}")
-    with open(bible_path, 'r', encoding='utf-8') as f:
-        print(f"Successfully opened {bible_path}")
-        for line_num, line in enumerate(f, 1):
-            line = line.strip()
-            
+    for line_num, line in enumerate(lines, 1):
+        line = line.strip()
+        
+        line_markers = markers.get(line_num)
+        if line_markers:
             # Track book name
-            book = extract_book_name(line)
+            book = line_markers.get('book')
             if book:
                 current_book = book
                 current_chapter = None
@@ -654,201 +1054,193 @@ def process_bible_file(bible_path, output_path, check_typos=True):
                 print(f"Found book: {current_book}")
                 continue
             
-            # Track chapter number
-            chapter = extract_chapter_number(line)
+            # Track chapter number (lettrine marks the first chapter)
+            chapter = line_markers.get('chapter')
+            if chapter is None and 'lettrine' in line_markers:
+                chapter = 1
             if chapter:
                 current_chapter = chapter
                 # First verse is implied after chapter declaration
                 current_verse = 1
             
             # Track verse number
-            verse = extract_verse_number(line)
+            verse = line_markers.get('verse')
             if verse:
                 current_verse = verse
+        
+        # Extract and check Greek words
+        greek_words = extract_greek_words(line)
+        if greek_words:
+            # Build verse reference
+            verse_ref = "Unknown"
+            if current_book and current_chapter and current_verse:
+                verse_ref = f"{current_book} {current_chapter}:{current_verse}"
             
-            # Extract and check Greek words
-            greek_words = extract_greek_words(line)
-            if greek_words:
-                for word in greek_words:
-                    # First check if word is in accepted words list (skip if accepted)
-                    if ACCEPTED_WORDS:
-                        normalized_word = strip_diacritics(word.lower())
-                        if normalized_word in ACCEPTED_WORDS:
-                            continue
-                    
-                    # Check if this word has already been examined in this verse
-                    if ALREADY_EXAMINED and current_book and current_chapter and current_verse:
-                        verse_ref = f"{current_book} {current_chapter}:{current_verse}"
-                        normalized_word = strip_diacritics(word.lower())
-                        key = (verse_ref, normalized_word)
-                        if key in ALREADY_EXAMINED:
-                            continue
-                    
-                    if not is_word_in_sets(word):
-                        # Build verse reference
-                        verse_ref = "Unknown"
-                        if current_book and current_chapter and current_verse:
-                            verse_ref = f"{current_book} {current_chapter}:{current_verse}"
-                        
-                        # Check if likely proper name
-                        is_name = is_likely_proper_name(word) if check_typos else False
-                        
-                        # Check if likely number word
-                        is_number = is_likely_number_word(word) if check_typos else False
-                        
-                        # Check if likely typo (with optional verse-specific checking)
-                        if check_typos:
-                            words_checked += 1
-                            if words_checked % 100 == 0:
-                                print(f"  Checked {words_checked} words, found {typos_found} potential typos so far... (Current: {verse_ref})")
-                            
-                            is_typo, closest_match, similarity, verse_match, area_match, legitimate_variation = is_likely_typo(
-                                word, current_book, current_chapter, current_verse
-                            )
-                            
-                            if is_typo:
-                                typos_found += 1
-                        else:
-                            is_typo, closest_match, similarity, verse_match, area_match, legitimate_variation = False, None, 0, False, False, False
-                        
-                        missing_words.append({
-                            'line_num': line_num,
-                            'verse_ref': verse_ref,
-                            'word': word,
-                            'full_line': line,
-                            'is_name': is_name,
-                            'is_number': is_number,
-                            'is_typo': is_typo,
-                            'closest_match': closest_match if closest_match else '',
-                            'similarity': f"{similarity:.2f}" if similarity > 0 else '',
-                            'verse_match': verse_match,
-                            'area_match': area_match,
-                            'legitimate_variation': legitimate_variation
-                        })
-    
-    # Write results to log file
-    print(f"\nWriting results to {output_path}...")
-    print(f"Opening file for writing: {output_path}")
-    with open(output_path, 'w', encoding='utf-8', newline='') as f:
-        print(f"Successfully opened {output_path} for writing")
-        writer = csv.writer(f, delimiter='\t')
-        # Write header - simple format without typo check columns
-        writer.writerow(['Line Number', 'Verse Reference', 'Word', 'Full Line'])
+            # Repeated tokens on the same line share a single lookup
+            known_on_line = {}
+            for word in greek_words:
+                known = known_on_line.get(word)
+                if known is None:
+                    known = known_on_line[word] = is_word_known(word, verse_ref)
+                if not known:
+                    yield line_num, verse_ref, word, line, current_book, current_chapter, current_verse
+
+
+def process_bible_file(bible_path, output_path, check_typos=True, jobs=1):
+    """Process the Bible file and log missing words.
+    Uses global data structures (RAHLFS_WORDS_DICT, SWETE_WORDS_DICT, ACCEPTED_WORDS, etc.).
+    Rows are streamed to the output files in file order as each missing word is
+    checked; with jobs > 1 the typo checks run in a pool of worker processes.
+    """
+    
+    missing_count = 0
+    words_checked = 0
+    typos_found = 0
+    # Summary counts (names, numbers, likely typos, legitimate variations)
+    stats = Counter()
+    
+    print("Processing Bible file...")
+    if not check_typos:
+        print("Typo checking disabled for faster processing.")
+    
+    print(f"Opening Bible file for reading: {bible_path}")
+    with open(bible_path, 'r', encoding='utf-8') as f:
+        print(f"Successfully opened {bible_path}")
+        text = f.read()
+    
+    # Locate all book/chapter/verse markers in one pass over the file
+    markers = scan_markers(text)
+    missing_words = iter_missing_words(text.split('\n'), markers)
+    
+    typo_check_path = output_path.replace('.tsv', '_typo_check.tsv')
+    filtered_path = output_path.replace('.tsv', '_likely_typos.tsv')
+    variations_path = output_path.replace('.tsv', '_legitimate_variations.tsv')
+    
+    with ExitStack() as stack:
+        print(f"\nWriting results to {output_path}...")
+        # Simple format without typo check columns
+        writer = open_tsv_writer(stack, output_path,
+                                 ['Line Number', 'Verse Reference', 'Word', 'Full Line'])
+        if check_typos:
+            print(f"Writing full typo check results to {typo_check_path}...")
+            # All columns including verse match, area match, and legitimate variation
+            typo_check_writer = open_tsv_writer(stack, typo_check_path,
+                ['Line Number', 'Verse Reference', 'Word', 'Is Name?', 'Is Number?',
+                 'Likely Typo?', 'Closest Match', 'Similarity', 'Verse Match?', 'Area Match?',
+                 'Legitimate Variation?', 'Full Line'])
+            # Likely typos only (excluding numbers and legitimate variations)
+            print(f"Writing likely typos to {filtered_path}...")
+            filtered_writer = open_tsv_writer(stack, filtered_path,
+                ['Line Number', 'Verse Reference', 'Word', 'Closest Match', 'Similarity',
+                 'Verse Match?', 'Area Match?', 'Full Line'])
+            # Only created once the first legitimate variation is found
+            variations_writer = None
+        
+        # Pair each missing word with its (is_name, is_number, typo_result) checks
+        if not check_typos:
+            checked_words = ((entry, None) for entry in missing_words)
+        elif jobs > 1:
+            # Workers start on the first chunks while this process is still
+            # scanning the rest of the file; tee keeps the words for writing
+            print(f"Checking missing words for typos with {jobs} processes...")
+            missing_words, words_to_check = tee(missing_words)
+            pool = stack.enter_context(create_worker_pool(jobs))
+            checked_words = zip(missing_words,
+                                pool.map(classify_missing_word, words_to_check, chunksize=16))
+        else:
+            checked_words = ((entry, classify_missing_word(entry)) for entry in missing_words)
         
-        # Write data
-        for entry in missing_words:
-            writer.writerow([
-                entry['line_num'],
-                entry['verse_ref'],
-                entry['word'],
-                entry['full_line']
+        for (line_num, verse_ref, word, line, *_), checks in checked_words:
+            missing_count += 1
+            writer.writerow([line_num, verse_ref, word, line])
+            if checks is None:
+                continue
+            is_name, is_number, typo_result = checks
+            
+            words_checked += 1
+            if words_checked % 100 == 0:
+                print(f"  Checked {words_checked} words, found {typos_found} potential typos so far... (Current: {verse_ref})")
+            
+            is_typo, closest_match, similarity, verse_match, area_match, legitimate_variation = typo_result
+            
+            if is_typo:
+                typos_found += 1
+            
+            closest_match = closest_match if closest_match else ''
+            similarity = f"{similarity:.2f}" if similarity > 0 else ''
+            stats['names'] += is_name
+            stats['numbers'] += is_number
+            
+            typo_check_writer.writerow([
+                line_num,
+                verse_ref,
+                word,
+                'Yes' if is_name else 'No',
+                'Yes' if is_number else 'No',
+                'Yes' if is_typo else 'No',
+                closest_match,
+                similarity,
+                'Yes' if verse_match else 'No',
+                'Yes' if area_match else 'No',
+                'Yes' if legitimate_variation else 'No',
+                line
             ])
-        print(f"Finished writing {len(missing_words)} rows to {output_path}")
-    
-    # Write full typo check results if enabled
-    if check_typos:
-        typo_check_path = output_path.replace('.tsv', '_typo_check.tsv')
-        print(f"Writing full typo check results to {typo_check_path}...")
-        print(f"Opening file for writing: {typo_check_path}")
-        with open(typo_check_path, 'w', encoding='utf-8', newline='') as f:
-            print(f"Successfully opened {typo_check_path} for writing")
-            writer = csv.writer(f, delimiter='\t')
-            # Write header with all columns including verse match, area match, and legitimate variation
-            writer.writerow(['Line Number', 'Verse Reference', 'Word', 'Is Name?', 'Is Number?', 
-                            'Likely Typo?', 'Closest Match', 'Similarity', 'Verse Match?', 'Area Match?', 
-                            'Legitimate Variation?', 'Full Line'])
             
-            # Write data
-            for entry in missing_words:
-                writer.writerow([
-                    entry['line_num'],
-                    entry['verse_ref'],
-                    entry['word'],
-                    'Yes' if entry['is_name'] else 'No',
-                    'Yes' if entry['is_number'] else 'No',
-                    'Yes' if entry['is_typo'] else 'No',
-                    entry['closest_match'],
-                    entry['similarity'],
-                    'Yes' if entry.get('verse_match', False) else 'No',
-                    'Yes' if entry.get('area_match', False) else 'No',
-                    'Yes' if entry.get('legitimate_variation', False) else 'No',
-                    entry['full_line']
+            if is_typo and not is_number and not legitimate_variation:
+                stats['likely_typos'] += 1
+                stats['likely_typo_verse_matches'] += verse_match
+                stats['likely_typo_area_matches'] += area_match
+                filtered_writer.writerow([
+                    line_num,
+                    verse_ref,
+                    word,
+                    closest_match,
+                    similarity,
+                    'Yes' if verse_match else 'No',
+                    'Yes' if area_match else 'No',
+                    line
                 ])
-            print(f"Finished writing {len(missing_words)} rows to {typo_check_path}")
-    
-    # Create a filtered file with likely typos only (excluding legitimate variations)
-    if check_typos:
-        filtered_path = output_path.replace('.tsv', '_likely_typos.tsv')
-        likely_typos = [e for e in missing_words 
-                       if e['is_typo'] and not e['is_number'] 
-                       and not e.get('legitimate_variation', False)]
-        
-        print(f"Writing likely typos to {filtered_path}...")
-        print(f"Opening file for writing: {filtered_path}")
-        with open(filtered_path, 'w', encoding='utf-8', newline='') as f:
-            print(f"Successfully opened {filtered_path} for writing")
-            writer = csv.writer(f, delimiter='\t')
-            # Write header with verse match and area match columns
-            writer.writerow(['Line Number', 'Verse Reference', 'Word', 'Closest Match', 'Similarity', 'Verse Match?', 'Area Match?', 'Full Line'])
             
-            # Write data
-            for entry in likely_typos:
-                writer.writerow([
-                    entry['line_num'],
-                    entry['verse_ref'],
-                    entry['word'],
-                    entry['closest_match'],
-                    entry['similarity'],
-                    'Yes' if entry.get('verse_match', False) else 'No',
-                    'Yes' if entry.get('area_match', False) else 'No',
-                    entry['full_line']
+            if legitimate_variation:
+                stats['variations'] += 1
+                stats['variation_verse_matches'] += verse_match
+                stats['variation_area_matches'] += area_match
+                if variations_writer is None:
+                    print(f"Writing legitimate variations to {variations_path}...")
+                    variations_writer = open_tsv_writer(stack, variations_path,
+                        ['Line Number', 'Verse Reference', 'Word', 'Matched Variation',
+                         'Verse Match?', 'Area Match?', 'Full Line'])
+                variations_writer.writerow([
+                    line_num,
+                    verse_ref,
+                    word,
+                    closest_match,
+                    'Yes' if verse_match else 'No',
+                    'Yes' if area_match else 'No',
+                    line
                 ])
-            print(f"Finished writing {len(likely_typos)} rows to {filtered_path}")
-        
-        # Create a separate file for legitimate variations found
-        variations_path = output_path.replace('.tsv', '_legitimate_variations.tsv')
-        legitimate_variations = [e for e in missing_words if e.get('legitimate_variation', False)]
-        
-        if legitimate_variations:
-            print(f"Writing legitimate variations to {variations_path}...")
-            print(f"Opening file for writing: {variations_path}")
-            with open(variations_path, 'w', encoding='utf-8', newline='') as f:
-                print(f"Successfully opened {variations_path} for writing")
-                writer = csv.writer(f, delimiter='\t')
-                writer.writerow(['Line Number', 'Verse Reference', 'Word', 'Matched Variation', 'Verse Match?', 'Area Match?', 'Full Line'])
-                
-                for entry in legitimate_variations:
-                    writer.writerow([
-                        entry['line_num'],
-                        entry['verse_ref'],
-                        entry['word'],
-                        entry['closest_match'],
-                        'Yes' if entry.get('verse_match', False) else 'No',
-                        'Yes' if entry.get('area_match', False) else 'No',
-                        entry['full_line']
-                    ])
-                print(f"Finished writing {len(legitimate_variations)} rows to {variations_path}")
-    
-    print(f"\nComplete! Found {len(missing_words)} missing words.")
+    
+    print(f"Finished writing {missing_count} rows to {output_path}")
+    if check_typos:
+        print(f"Finished writing {missing_count} rows to {typo_check_path}")
+        print(f"Finished writing {stats['likely_typos']} rows to {filtered_path}")
+        if stats['variations']:
+            print(f"Finished writing {stats['variations']} rows to {variations_path}")
+    
+    print(f"\nComplete! Found {missing_count} missing words.")
     if check_typos:
-        print(f"  - Likely proper names: {sum(1 for e in missing_words if e['is_name'])}")
-        print(f"  - Likely numbers: {sum(1 for e in missing_words if e['is_number'])}")
-        print(f"  - Legitimate variations: {sum(1 for e in missing_words if e.get('legitimate_variation', False))}")
-        legitimate_variations = [e for e in missing_words if e.get('legitimate_variation', False)]
-        if legitimate_variations:
-            verse_var = sum(1 for e in legitimate_variations if e.get('verse_match', False))
-            area_var = sum(1 for e in legitimate_variations if e.get('area_match', False))
-            print(f"    - Found in verse: {verse_var}")
-            print(f"    - Found in area (±20 verses): {area_var}")
+        print(f"  - Likely proper names: {stats['names']}")
+        print(f"  - Likely numbers: {stats['numbers']}")
+        print(f"  - Legitimate variations: {stats['variations']}")
+        if stats['variations']:
+            print(f"    - Found in verse: {stats['variation_verse_matches']}")
+            print(f"    - Found in area (±20 verses): {stats['variation_area_matches']}")
         
-        likely_typos = [e for e in missing_words 
-                       if e['is_typo'] and not e['is_number'] 
-                       and not e.get('legitimate_variation', False)]
-        print(f"  - Likely typos: {len(likely_typos)}")
-        if likely_typos:
-            verse_matches = sum(1 for e in likely_typos if e.get('verse_match', False))
-            area_matches = sum(1 for e in likely_typos if e.get('area_match', False))
-            corpus_matches = len(likely_typos) - verse_matches - area_matches
+        print(f"  - Likely typos: {stats['likely_typos']}")
+        if stats['likely_typos']:
+            verse_matches = stats['likely_typo_verse_matches']
+            area_matches = stats['likely_typo_area_matches']
+            corpus_matches = stats['likely_typos'] - verse_matches - area_matches
             print(f"    - Matched within verse: {verse_matches}")
             print(f"    - Matched within area (±20 verses): {area_matches}")
             print(f"    - Matched in broader corpus: {corpus_matches}")
@@ -856,15 +1248,18 @@ def process_bible_file(bible_path, output_path, check_typos=True):
     if check_typos:
         print(f"Full typo check results saved to: {typo_check_path}")
         print(f"Filtered typos saved to: {filtered_path}")
-        if legitimate_variations:
+        if stats['variations']:
             print(f"Legitimate variations saved to: {variations_path}")
 
 
 def main():
     """Main entry point."""
     global RAHLFS_WORDS_DICT, SWETE_WORDS_DICT, RAHLFS_WORDS, SWETE_WORDS
+    global RAHLFS_MAX_WORD_ID, SWETE_MAX_WORD_ID
+    global KNOWN_WORDS, KNOWN_WORD_FORMS, COMPARISON_FORMS, RAHLFS_LENGTH_INDEX, SWETE_LENGTH_INDEX
     global RAHLFS_VERSE_MAP, SWETE_VERSE_MAP
-    global RAHLFS_SORTED_VERSES, SWETE_SORTED_VERSES, ACCEPTED_WORDS, ALREADY_EXAMINED
+    global RAHLFS_SORTED_VERSES, SWETE_SORTED_VERSES, RAHLFS_VERSE_INDEX, SWETE_VERSE_INDEX
+    global ACCEPTED_WORDS, ALREADY_EXAMINED
     
     parser = argparse.ArgumentParser(
         description='Check for Greek words in Bible file that are not found in reference word lists.',
@@ -877,6 +1272,9 @@ Examples:
   # Run without typo checking (faster):
   python check_missing_words.py --no-typo-check
   
+  # Run typo checking in 4 worker processes:
+  python check_missing_words.py --jobs 4
+  
   # Specify custom input files:
   python check_missing_words.py --bible MyBible.tex --rahlfs rahlfs.csv
         """
@@ -900,6 +1298,10 @@ Examples:
                         help='Path to already examined word changes file (default: word_corrections.tsv)')
     parser.add_argument('--no-typo-check', action='store_true',
                         help='Disable typo checking for faster processing')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Re-parse the word CSV files instead of using the on-disk cache')
+    parser.add_argument('--jobs', type=int, default=1,
+                        help='Number of processes for typo checking (default: 1)')
     
     args = parser.parse_args()
     
@@ -910,12 +1312,19 @@ Examples:
     
     print("Loading word data...")
     
-    # Load word IDs into global variables (single CSV read per file)
-    RAHLFS_WORDS_DICT = load_words_with_ids(args.rahlfs)
+    # Load word IDs into global variables (single CSV read per file).
+    # The two files are independent, so read them concurrently.
+    load_words = load_words_with_ids if args.no_cache else load_words_with_ids_cached
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        rahlfs_future = executor.submit(load_words, args.rahlfs)
+        swete_future = executor.submit(load_words, args.swete)
+        RAHLFS_WORDS_DICT = rahlfs_future.result()
+        SWETE_WORDS_DICT = swete_future.result()
     print(f"Loaded {len(RAHLFS_WORDS_DICT)} word IDs from Rahlfs")
-    
-    SWETE_WORDS_DICT = load_words_with_ids(args.swete)
     print(f"Loaded {len(SWETE_WORDS_DICT)} word IDs from Swete")
+    # Where the last verse of each edition ends
+    RAHLFS_MAX_WORD_ID = max(RAHLFS_WORDS_DICT, default=0)
+    SWETE_MAX_WORD_ID = max(SWETE_WORDS_DICT, default=0)
     
     # Derive normalized->original mappings once at startup
     print("Deriving normalized word sets...")
@@ -925,6 +1334,13 @@ Examples:
     SWETE_WORDS = derive_word_set(SWETE_WORDS_DICT)
     print(f"Derived {len(SWETE_WORDS)} unique words from Swete")
     
+    # Combine both editions into one set so membership needs a single probe
+    KNOWN_WORDS = frozenset(RAHLFS_WORDS.keys() | SWETE_WORDS.keys())
+    print(f"Combined {len(KNOWN_WORDS)} unique words from both editions")
+    # Also accept words that are known once a dropped movable ν is restored,
+    # so a membership check needs a single probe
+    KNOWN_WORD_FORMS = KNOWN_WORDS.union(word[:-1] for word in KNOWN_WORDS if word.endswith('ν'))
+    
     ACCEPTED_WORDS = load_accepted_words(args.accepted_words)
     if ACCEPTED_WORDS:
         print(f"Loaded {len(ACCEPTED_WORDS)} accepted words")
@@ -935,14 +1351,20 @@ Examples:
     
     # Load versification data for verse-specific typo checking
     if check_typos:
+        # Typo scoring compares corpus words over and over; prepare their comparison forms once
+        COMPARISON_FORMS = {word: normalize_for_comparison(word) for word in KNOWN_WORDS}
+        print(f"Prepared comparison forms for {len(COMPARISON_FORMS)} words")
+        RAHLFS_LENGTH_INDEX = build_length_index(RAHLFS_WORDS)
+        SWETE_LENGTH_INDEX = build_length_index(SWETE_WORDS)
+        
         print("Loading versification for verse-specific typo checking...")
-        RAHLFS_VERSE_MAP, RAHLFS_SORTED_VERSES = load_versification(args.rahlfs_versification)
+        RAHLFS_VERSE_MAP, RAHLFS_SORTED_VERSES, RAHLFS_VERSE_INDEX = load_versification(args.rahlfs_versification)
         print(f"Loaded {len(RAHLFS_VERSE_MAP)} verses from Rahlfs versification")
         
-        SWETE_VERSE_MAP, SWETE_SORTED_VERSES = load_versification(args.swete_versification)
+        SWETE_VERSE_MAP, SWETE_SORTED_VERSES, SWETE_VERSE_INDEX = load_versification(args.swete_versification)
         print(f"Loaded {len(SWETE_VERSE_MAP)} verses from Swete versification")
     
-    process_bible_file(bible_path, output_path, check_typos)
+    process_bible_file(bible_path, output_path, check_typos, args.jobs)
 
 
 if __name__ == '__main__':
@@ -19,6 +19,7 @@ Example:
 
 import argparse
 import difflib
+import json
 import os
 import re
 from pathlib import Path
@@ -284,8 +285,6 @@ def compare_verses_gemini(
 
     results: Dict[str, str] = {}
 
-    import json  # local import so script still runs without LLM
-
     for batch in chunks(verse_pairs, batch_size):
         # Build prompt for this batch
         lines = []
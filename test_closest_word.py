@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""Test that the length-indexed typo search matches the plain in-order scan."""
+
+import random
+from itertools import islice
+
+from check_missing_words import build_length_index, find_best_match, find_closest_word, normalize_word
+
+def load_sample_words(filepath, max_lines=3000):
+    """Load normalized -> original words from the start of a words CSV,
+    plus compound combinations of consecutive words like get_words_by_id_range."""
+    words = []
+    with open(filepath, 'r', encoding='utf-8') as f:
+        for line in islice(f, max_lines):
+            row = line.rstrip('\r\n').split('\t')
+            if len(row) >= 2:
+                words.append(row[-1].lower())
+    word_dict = {}
+    for word in words:
+        word_dict.setdefault(normalize_word(word), word)
+    for word1, word2 in zip(words, words[1:]):
+        word_dict.setdefault(normalize_word(word1) + normalize_word(word2), word1 + ' ' + word2)
+    return word_dict
+
+def perturb(word, rng):
+    """Return a copy of word with one random edit."""
+    letters = 'αβγδεζηθικλμνξοπρστυφχψω'
+    i = rng.randrange(len(word))
+    edit = rng.choice(['substitute', 'delete', 'insert', 'transpose'])
+    if edit == 'substitute':
+        return word[:i] + rng.choice(letters) + word[i + 1:]
+    if edit == 'delete' and len(word) > 1:
+        return word[:i] + word[i + 1:]
+    if edit == 'transpose' and i + 1 < len(word):
+        return word[:i] + word[i + 1] + word[i] + word[i + 2:]
+    return word[:i] + rng.choice(letters) + word[i:]
+
+def make_queries(word_dict, rng, count=300):
+    """Build perturbed, final-sigma and movable-nu queries from the dict's words,
+    plus random letter strings."""
+    keys = [key for key in word_dict if key]
+    queries = [perturb(rng.choice(keys), rng) for _ in range(count)]
+    # Medial σ written as ς (and back), which only differ in comparison form
+    queries += [key.replace('σ', 'ς', 1) for key in keys if 'σ' in key[:-1]][:50]
+    queries += [key[:-1].replace('ς', 'σ') + key[-1] for key in keys if 'ς' in key[:-1]][:50]
+    # Words with a dropped movable ν, which retry with the ν restored
+    queries += [key[:-1] for key in keys if key.endswith(('εν', 'ιν'))][:50]
+    queries += [perturb(key[:-1], rng) + key[-2] for key in keys if key.endswith(('εν', 'ιν'))][:50]
+    # Exact keys, which can only tie with equal comparison forms
+    queries += rng.sample(keys, 50)
+    # Unrelated letter strings, whose weak best matches often tie across lengths
+    letters = 'αβγδεζηθικλμνξοπρστυφχψω'
+    queries += [''.join(rng.choice(letters) for _ in range(rng.randint(2, 8))) for _ in range(200)]
+    return queries
+
+def test_indexed_search_matches_scan():
+    """find_closest_word and find_best_match must give the same result with
+    and without a length index."""
+    rng = random.Random(1)
+    word_dict = load_sample_words('rahlfs_words.csv')
+    length_index = build_length_index(word_dict)
+    queries = make_queries(word_dict, rng)
+
+    print(f"Comparing {len(queries)} queries against {len(word_dict)} words:\n")
+    failures = 0
+    for query in queries:
+        expected = find_closest_word(query, word_dict)
+        actual = find_closest_word(query, word_dict, length_index)
+        if actual != expected:
+            failures += 1
+            print(f"  ✗ FAIL: {query}: scan {expected}, indexed {actual}")
+        # Without the 0.80 floor, equal ratios also occur across different
+        # lengths, where the earliest word must still win
+        expected = find_best_match(word_dict, query)
+        actual = find_best_match(word_dict, query, length_index=length_index)
+        if actual != expected:
+            failures += 1
+            print(f"  ✗ FAIL: {query} (no floor): scan {expected}, indexed {actual}")
+
+    if failures:
+        print(f"✗ {failures} queries differ")
+    else:
+        print("✓ All tests passed!")
+    assert failures == 0
+
+if __name__ == '__main__':
+    test_indexed_search_matches_scan()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""Test that the prefix-factored number regex matches the plain substring search."""
+
+import random
+import re
+
+from check_missing_words import NUMBER_PATTERN, NUMBER_PATTERNS, build_trie_pattern, normalize_word
+
+def matches_any(word, patterns):
+    """The substring check NUMBER_PATTERN replaces."""
+    return any(pattern in word for pattern in patterns)
+
+def test_number_pattern():
+    """NUMBER_PATTERN.search must agree with the substring check on corpus words."""
+    words = set()
+    with open('rahlfs_words.csv', 'r', encoding='utf-8') as f:
+        for line in f:
+            row = line.rstrip('\r\n').split('\t')
+            if len(row) >= 2:
+                words.add(normalize_word(row[-1]))
+    
+    print(f"Checking NUMBER_PATTERN against {len(words)} Rahlfs words:\n")
+    failures = [word for word in words
+                if (NUMBER_PATTERN.search(word) is not None) != matches_any(word, NUMBER_PATTERNS)]
+    for word in failures[:10]:
+        print(f"  ✗ FAIL: {word}")
+    number_count = sum(matches_any(word, NUMBER_PATTERNS) for word in words)
+    print(f"  {number_count} words contain a number pattern")
+    assert not failures
+
+def test_build_trie_pattern():
+    """build_trie_pattern must agree with the substring check on arbitrary word lists,
+    including words that are prefixes of each other and the degenerate inputs."""
+    rng = random.Random(1)
+    letters = 'αβγδε'
+    for _ in range(200):
+        patterns = [''.join(rng.choice(letters) for _ in range(rng.randint(1, 4)))
+                    for _ in range(rng.randint(1, 6))]
+        regex = re.compile(build_trie_pattern(patterns))
+        for _ in range(20):
+            word = ''.join(rng.choice(letters) for _ in range(rng.randint(0, 8)))
+            assert (regex.search(word) is not None) == matches_any(word, patterns), (patterns, word)
+    
+    # No words matches nothing; an empty word matches everything
+    assert build_trie_pattern([]) == '(?!)'
+    assert re.search(build_trie_pattern([]), 'δεκα') is None
+    assert re.search(build_trie_pattern(['']), 'δεκα') is not None
+    print("✓ build_trie_pattern agrees with the substring check")
+
+if __name__ == '__main__':
+    test_number_pattern()
+    test_build_trie_pattern()
+    print("✓ All tests passed!")
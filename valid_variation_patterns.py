@@ -7,12 +7,30 @@ These are legitimate textual/dialectal variants that should NOT be flagged as er
 import unicodedata
 from itertools import product
 
+class CombiningMarksTable(dict):
+    """str.translate table deleting every nonspacing combining mark (category 'Mn').
+    Code points are classified on first lookup and remembered, instead of
+    scanning all of Unicode up front, which made every import noticeably slower.
+    """
+    def __missing__(self, codepoint):
+        replacement = None if unicodedata.category(chr(codepoint)) == 'Mn' else codepoint
+        self[codepoint] = replacement
+        return replacement
+
+
+COMBINING_MARKS_TABLE = CombiningMarksTable()
+
 def strip_accents(text):
     """Remove Greek accents for pattern matching."""
-    # Normalize to NFD (decomposed form) so accents are separate
-    nfd = unicodedata.normalize('NFD', text)
-    # Filter out combining marks (accents)
-    return ''.join(c for c in nfd if unicodedata.category(c) != 'Mn')
+    # ASCII text has no accents to remove
+    if text.isascii():
+        return text
+    # Normalize to NFD (decomposed form) so accents are separate,
+    # unless the quick check shows it already is
+    if not unicodedata.is_normalized('NFD', text):
+        text = unicodedata.normalize('NFD', text)
+    # Delete combining marks (accents) in a single C-level pass
+    return text.translate(COMBINING_MARKS_TABLE)
 
 
 def generate_positional_variations(text, pattern1, pattern2):
@@ -156,6 +174,13 @@ VARIATION_PATTERNS = {
     ],
 }
 
+# The same patterns with accents stripped, matching the stripped words that
+# apply_all_patterns_from_list works on; computed once at import
+STRIPPED_VARIATION_PATTERNS = {
+    pattern_key: [tuple(strip_accents(p) for p in pattern_group) for pattern_group in patterns]
+    for pattern_key, patterns in VARIATION_PATTERNS.items()
+}
+
 # Specific word variants (not pattern-based)
 SPECIFIC_WORD_VARIANTS = {
     'δίδραγμον': ['διδραχμον', 'δίδραχμον'],
@@ -264,14 +289,14 @@ def apply_all_patterns_from_list(current_variations, pattern_key, bidirectional=
         Set of new variations after applying patterns
     """
     new_variations = set()
-    patterns = VARIATION_PATTERNS[pattern_key]
+    # Patterns are already accent-stripped to match the stripped word
+    patterns = STRIPPED_VARIATION_PATTERNS[pattern_key]
     
     for var in current_variations:
         new_variations.add(var)
         for pattern_group in patterns:
             if len(pattern_group) == 2:
-                # Strip accents from patterns to match the stripped word
-                p1, p2 = strip_accents(pattern_group[0]), strip_accents(pattern_group[1])
+                p1, p2 = pattern_group
                 # Special handling for ει↔ι with positional variations
                 if positional and pattern_key == 'diphthong' and ((p1 == 'ει' and p2 == 'ι') or (p1 == 'ι' and p2 == 'ει')):
                     if 'ει' in var:
@@ -285,8 +310,7 @@ def apply_all_patterns_from_list(current_variations, pattern_key, bidirectional=
                     if bidirectional and p2 in var:
                         new_variations.add(var.replace(p2, p1))
             elif len(pattern_group) == 3:
-                # Strip accents from patterns to match the stripped word
-                p1, p2, p3 = strip_accents(pattern_group[0]), strip_accents(pattern_group[1]), strip_accents(pattern_group[2])
+                p1, p2, p3 = pattern_group
                 # Apply all pairwise replacements
                 if p1 in var:
                     new_variations.add(var.replace(p1, p2))